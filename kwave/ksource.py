@@ -31,6 +31,18 @@ class kSource(object):
     s_mask          = None      #: Stress source mask
     s_mode          = None      #: Stress source mode
 
+    def __copy__(self):
+        """
+            Shallow copy of the source. The initial pressure `p0` is shared as a read-only view, so the copy
+            can rebind it but cannot modify the original in place
+        """
+        source = self.__class__.__new__(self.__class__)
+        source.__dict__.update(self.__dict__)
+        if isinstance(self._p0, np.ndarray):
+            source._p0 = self._p0.view()
+            source._p0.flags.writeable = False
+        return source
+
     def is_p0_empty(self) -> bool:
         """
             Check if the `p0` field is set and not empty
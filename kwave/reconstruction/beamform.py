@@ -145,7 +145,7 @@ def focus(kgrid, input_signal, source_mask, focus_position, sound_speed):
 
     assert isinstance(sound_speed, float), "sound_speed must be a scalar."
 
-    positions = [kgrid.x.flatten(), kgrid.y.flatten(), kgrid.z.flatten()]
+    positions = [kgrid.x.ravel(), kgrid.y.ravel(), kgrid.z.ravel()]
 
     # filter_positions
     positions = [position for position in positions if (position != np.nan).any()]
@@ -156,7 +156,7 @@ def focus(kgrid, input_signal, source_mask, focus_position, sound_speed):
         focus_position = np.array(focus_position)
     assert isinstance(focus_position, np.ndarray)
 
-    dist = np.linalg.norm(positions[:, source_mask.flatten() == 1] - focus_position[:, np.newaxis])
+    dist = np.linalg.norm(positions[:, source_mask.ravel() == 1] - focus_position[:, np.newaxis])
 
     # distance to delays
     delay = int(np.round(dist / (kgrid.dt * sound_speed)))
@@ -222,7 +222,7 @@ def scan_conversion(
     # However, we don't want to add custom logic to the `interpolate2D_with_queries` method.
 
     # Modifications -start
-    queries = np.array([r_cart.flatten(), th_cart.flatten()]).T
+    queries = np.array([r_cart.ravel(), th_cart.ravel()]).T
 
     b_mode = interpolate2d_with_queries(
         [r, 2 * np.pi * steering_angles / 360],
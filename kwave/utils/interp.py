@@ -376,7 +376,7 @@ def interp_cart_data(kgrid, cart_sensor_data, cart_sensor_mask, binary_sensor_ma
 
     # extract the number of data points
     num_cart_data_points, num_time_points = cart_sensor_data.shape
-    num_binary_sensor_points = np.sum(binary_sensor_mask.flatten())
+    num_binary_sensor_points = np.sum(binary_sensor_mask.ravel())
 
     # update command line status
     print('Interpolating Cartesian sensor data...')
@@ -536,7 +536,7 @@ def make_cart_circle(radius, num_points, center_pos=(0, 0), arc_angle=2 * np.pi,
     return np.squeeze(circle)
 
 
-def make_disc(Nx, Ny, cx, cy, radius, plot_disc=False):
+def make_disc(Nx, Ny, cx, cy, radius, plot_disc=False, x_slice=None, y_slice=None):
     """
     Create a binary map of a filled disc within a 2D grid.
 
@@ -553,6 +553,9 @@ def make_disc(Nx, Ny, cx, cy, radius, plot_disc=False):
         cy (int): The y-coordinate of the disc centre.
         radius (int): The radius of the disc.
         plot_disc (bool): If set to True, the disc will be plotted using Matplotlib.
+        x_slice (slice): Optional slice of the x-axis to return. Only the selected grid points are computed, which
+            is equivalent to, but cheaper than, make_disc(...)[x_slice, :].
+        y_slice (slice): Optional slice of the y-axis to return, as for x_slice.
 
     Returns:
         np.ndarray: A binary map of the disc in the 2D grid.
@@ -576,20 +579,22 @@ def make_disc(Nx, Ny, cx, cy, radius, plot_disc=False):
     # check the inputs
     assert (0 <= cx < Nx) and (0 <= cy < Ny), 'Disc center must be within grid.'
 
-    # create empty matrix
-    disc = np.zeros((Nx, Ny))
+    # define the distance of each grid point from the disc centre along each
+    # dimension, wrapping around the grid edges, for the requested grid points
+    nx = (np.arange(Nx) - cx + math.ceil(Nx / 2)) % Nx - math.ceil(Nx / 2) + 1
+    ny = (np.arange(Ny) - cy + math.ceil(Ny / 2)) % Ny - math.ceil(Ny / 2) + 1
+    if x_slice is not None:
+        nx = nx[x_slice]
+    if y_slice is not None:
+        ny = ny[y_slice]
 
-    # define np.pixel map
-    r = make_pixel_map(Nx, Ny, None, 'Shift', [0, 0])
+    # define the pixel map
+    r = np.sqrt(nx[:, np.newaxis] ** 2 + ny[np.newaxis, :] ** 2)
 
     # create disc
+    disc = np.zeros(r.shape)
     disc[r <= radius] = MAGNITUDE
 
-    # shift centre
-    cx = cx - int(math.ceil(Nx / 2))
-    cy = cy - int(math.ceil(Ny / 2))
-    disc = np.roll(disc, (cx, cy), axis=(0, 1))
-
     # create the figure
     if plot_disc:
         raise NotImplementedError
@@ -1,13 +1,30 @@
+import functools
+import logging
 import warnings
 from typing import Tuple
 
 import numpy as np
-from scipy.interpolate import interpn, interp1d
+from scipy.interpolate import interpn, make_interp_spline
 
 from .checks import num_dim2
 from .conversion import scale_time
 from .tictoc import TicToc
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# pad_width builders for expand_matrix, keyed on (number of dimensions, number of coefficients)
+_PAD_WIDTH_BUILDERS = {
+    (1, 2): lambda exp_coeff: exp_coeff,
+    (2, 2): lambda exp_coeff: exp_coeff,
+    (2, 4): lambda exp_coeff: exp_coeff.reshape(2, 2),
+    (3, 3): lambda exp_coeff: np.broadcast_to(exp_coeff.reshape(-1, 1), (3, 2)),
+    (3, 6): lambda exp_coeff: exp_coeff.reshape(3, 2),
+}
+
 
 def expand_matrix(matrix, exp_coeff, edge_val=None):
     """
@@ -44,29 +61,104 @@ def expand_matrix(matrix, exp_coeff, edge_val=None):
         opts['mode'] = 'constant'
         opts['constant_values'] = edge_val
 
-    exp_coeff = np.array(exp_coeff).astype(int).squeeze()
-    n_coeff = exp_coeff.size
-    assert n_coeff > 0
-
-    if n_coeff == 1:
+    if isinstance(exp_coeff, (int, np.integer)):
         opts['pad_width'] = exp_coeff
-    elif len(matrix.shape) == 1:
-        assert n_coeff <= 2
-        opts['pad_width'] = exp_coeff
-    elif len(matrix.shape) == 2:
-        if n_coeff == 2:
+    else:
+        exp_coeff = np.asarray(exp_coeff).astype(int, copy=False).ravel()
+        n_coeff = exp_coeff.size
+        assert n_coeff > 0
+
+        if n_coeff == 1:
             opts['pad_width'] = exp_coeff
-        if n_coeff == 4:
-            opts['pad_width'] = [(exp_coeff[0], exp_coeff[1]), (exp_coeff[2], exp_coeff[3])]
-    elif len(matrix.shape) == 3:
-        if n_coeff == 3:
-            opts['pad_width'] = np.tile(np.expand_dims(exp_coeff, axis=-1), [1, 2])
-        if n_coeff == 6:
-            opts['pad_width'] = [(exp_coeff[0], exp_coeff[1]), (exp_coeff[2], exp_coeff[3]), (exp_coeff[4], exp_coeff[5])]
+        else:
+            try:
+                pad_width_builder = _PAD_WIDTH_BUILDERS[(matrix.ndim, n_coeff)]
+            except KeyError:
+                raise ValueError(f'{n_coeff} expansion coefficients are not supported for a {matrix.ndim}D matrix.')
+            opts['pad_width'] = pad_width_builder(exp_coeff)
+
+    # zero padding only needs the original matrix written into a zeroed array
+    if edge_val is not None and np.isscalar(edge_val) and edge_val == 0:
+        pad_width = np.broadcast_to(opts['pad_width'], (matrix.ndim, 2))
+        if np.all(pad_width >= 0):
+            expanded_matrix = np.zeros(np.add(matrix.shape, pad_width.sum(axis=1)), dtype=matrix.dtype)
+            inner = tuple(slice(before, before + size) for (before, _), size in zip(pad_width, matrix.shape))
+            expanded_matrix[inner] = matrix
+            return expanded_matrix
 
     return np.pad(matrix, **opts)
 
 
+def _nearest_index(in_size, out_size):
+    """
+    Index of the nearest input sample for each output sample along one axis, with both axes normalised to [0, 1].
+    Half-way points are rounded down, consistent with scipy.interpolate.interpn.
+    """
+    if in_size == 1:
+        return np.zeros(out_size, dtype=np.intp)
+    axis = np.linspace(0, 1, in_size)
+    new_axis = np.linspace(0, 1, out_size)
+    index = np.clip(np.searchsorted(axis, new_axis) - 1, 0, in_size - 2)
+    norm_dist = (new_axis - axis[index]) / (axis[index + 1] - axis[index])
+    return np.where(norm_dist <= 0.5, index, index + 1)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_resampler(in_shape, out_shape, interp_mode):
+    """
+    Build a function resampling matrices of shape in_shape to out_shape. The per-axis sample positions are computed
+    once and reused for repeated calls with the same geometry.
+    """
+    if interp_mode == 'nearest':
+        new_index = np.ix_(*[_nearest_index(in_size, out_size) for in_size, out_size in zip(in_shape, out_shape)])
+
+        def resample(mat):
+            return mat[new_index].astype(np.result_type(mat.dtype, np.float64), copy=False)
+
+        return resample
+
+    if interp_mode == 'linear':
+        # linear interpolation on a regular grid is separable, so interpolate
+        # along one axis at a time rather than building a dense coordinate grid
+        axis_weights = []
+        for in_size, out_size in zip(in_shape, out_shape):
+            axis = np.linspace(0, in_size - 1, out_size)
+            i0 = np.clip(np.floor(axis).astype(np.intp), 0, max(in_size - 2, 0))
+            i1 = np.minimum(i0 + 1, in_size - 1)
+            axis_weights.append((i0, i1, axis - i0))
+
+        def resample(mat):
+            mat_rs = mat.astype(np.result_type(mat.dtype, np.float64), copy=False)
+            for dim, (i0, i1, w) in enumerate(axis_weights):
+                w = broadcast_axis(w, mat_rs.ndim, dim)
+                mat_rs = (1 - w) * np.take(mat_rs, i0, axis=dim) + w * np.take(mat_rs, i1, axis=dim)
+            return mat_rs
+
+        return resample
+
+    # normalise the input and output grids to [0, 1]
+    axis = [np.linspace(0, 1, in_size) for in_size in in_shape]
+    new_axis = [np.linspace(0, 1, out_size) for out_size in out_shape]
+
+    if interp_mode == 'cubic':
+        # the tensor-product cubic spline used by scipy.interpolate.interpn is
+        # also separable, so fit and evaluate it along one axis at a time
+        def resample(mat):
+            mat_rs = mat.astype(np.result_type(mat.dtype, np.float64), copy=False)
+            for dim in range(mat_rs.ndim):
+                mat_rs = make_interp_spline(axis[dim], mat_rs, k=3, axis=dim)(new_axis[dim])
+            return mat_rs
+
+        return resample
+
+    # any other method is passed on to scipy.interpolate.interpn
+    def resample(mat):
+        new_points = np.stack(np.meshgrid(*new_axis, indexing='ij'), axis=-1)
+        return interpn(axis, mat, new_points, method=interp_mode)
+
+    return resample
+
+
 def resize(mat, new_size, interp_mode='linear'):
     """
     resize: resamples a "matrix" of spatial samples to a desired "resolution" or spatial sampling frequency via interpolation
@@ -74,49 +166,34 @@ def resize(mat, new_size, interp_mode='linear'):
     Args:
         mat:                matrix to be "resized" i.e. resampled
         new_size:         desired output resolution
-        interp_mode:        interpolation method
+        interp_mode:        interpolation method, 'linear', 'nearest' or 'cubic', or any other method supported by
+                            scipy.interpolate.interpn (e.g., 'splinef2d' for 2D matrices)
 
     Returns:
         res_mat:            "resized" matrix
 
     """
 
-    # start the timer
-    TicToc.tic()
-
-    # update command line status
-    print('Resizing matrix...')
+    # start the timer and update command line status, only if debug logging is enabled
+    verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if verbose:
+        TicToc.tic()
+        logging.debug('Resizing matrix...')
 
     # check inputs
-    assert num_dim2(mat) == len(new_size), \
+    assert mat.ndim == len(new_size) or num_dim2(mat) == len(new_size), \
         'Resolution input must have the same number of elements as data dimensions.'
 
-    mat = mat.squeeze()
-    mat_shape = mat.shape
-
-    axis = []
-    for dim in range(len(mat.shape)):
-        dim_size = mat.shape[dim]
-        axis.append(np.linspace(0, 1, dim_size))
-
-    new_axis = []
-    for dim in range(len(new_size)):
-        dim_size = new_size[dim]
-        new_axis.append(np.linspace(0, 1, dim_size))
-
-    points = tuple(p for p in axis)
-    xi = np.meshgrid(*new_axis)
-    xi = np.array([x.flatten() for x in xi]).T
-    new_points = xi
-    mat_rs = np.squeeze(interpn(points, mat, new_points, method=interp_mode))
-    # TODO: fix this hack.
-    if dim + 1 == 3:
-        mat_rs = mat_rs.reshape([new_size[1], new_size[0], new_size[2]])
-        mat_rs = np.transpose(mat_rs, (1, 0, 2))
-    else:
-        mat_rs = mat_rs.reshape(new_size, order='F')
+    # only collapse singleton dimensions if the caller's shape does not already match new_size
+    if mat.ndim != len(new_size):
+        mat = mat.squeeze()
+
+    resampler = _build_resampler(mat.shape, tuple(int(size) for size in new_size), interp_mode)
+    mat_rs = resampler(mat)
+
     # update command line status
-    print(f'  completed in {scale_time(TicToc.toc())}')
+    if verbose:
+        logging.debug(f'  completed in {scale_time(TicToc.toc())}')
     assert mat_rs.shape == tuple(new_size), "Resized matrix does not match requested size."
     return mat_rs
 
@@ -162,18 +239,40 @@ def gradient_fd(f, dx=None, dim=None, deriv_order=None, accuracy_order=None):
     if accuracy_order:
         warnings.warn("accuracy_order is no longer a supported argument.", DeprecationWarning)
 
+    return get_gradient_fn(dx, dim)(f)
+
+
+def get_gradient_fn(dx=None, dim=None):
+    """
+    Get a function computing the same gradient as gradient_fd(f, dx, dim) for an input f.
+
+    The grid spacing and dimension are bound once, so the returned function can be called repeatedly (e.g., inside a
+    time loop) without re-checking the optional arguments on every call.
+
+    Args:
+        dx:                 array of values for the grid point spacing in each
+                            dimension. If a value for dim is given, dn is the
+                            spacing in dimension dim.
+        dim:                optional input to specify a single dimension over which to compute the gradient for
+                            n-dimension input functions
+
+    Returns:
+        A function of f returning fx, fy, ...
+
+    """
     if dim is not None and dx is not None:
-        return np.gradient(f, dx, axis=dim)
+        return lambda f: np.gradient(f, dx, axis=dim)
     elif dim is not None:
-        return np.gradient(f, axis=dim)
+        return lambda f: np.gradient(f, axis=dim)
     elif dx is not None:
-        return np.gradient(f, dx)
+        return lambda f: np.gradient(f, dx)
     else:
-        return np.gradient(f)
+        return np.gradient
 
 
 def min_nd(matrix: np.ndarray) -> Tuple[float, Tuple]:
-    min_val, linear_index = np.min(matrix), matrix.argmin()
+    linear_index = matrix.argmin()
+    min_val = matrix.flat[linear_index]
     numpy_index = np.unravel_index(linear_index, matrix.shape)
     matlab_index = tuple(idx + 1 for idx in numpy_index)
     return min_val, matlab_index
@@ -191,8 +290,9 @@ def max_nd(matrix: np.ndarray) -> Tuple[float, Tuple]:
         maximum value. The index is given in the MATLAB convention, where indexing starts at 1.
 
     """
-    # Get the maximum value and its linear index
-    max_val, linear_index = np.max(matrix), matrix.argmax()
+    # Get the linear index of the maximum value, and look the value up from it
+    linear_index = matrix.argmax()
+    max_val = matrix.flat[linear_index]
 
     # Convert the linear index to a tuple of indices in the original matrix
     numpy_index = np.unravel_index(linear_index, matrix.shape)
@@ -220,33 +320,76 @@ def broadcast_axis(data: np.ndarray, ndims: int, axis: int) -> np.ndarray:
     return data.reshape(*newshape)
 
 
-def revolve2d(mat2D):
-    # start timer
-    TicToc.tic()
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _revolve_kernel(mat2D, i0, i1, w, oob, out):
+        # linearly interpolate each cross section of mat2D onto the radial grid
+        for x_index in prange(mat2D.shape[0]):
+            for k in range(i0.size):
+                if oob[k]:
+                    out[x_index, k] = 0.0
+                else:
+                    out[x_index, k] = (1 - w[k]) * mat2D[x_index, i0[k]] + w[k] * mat2D[x_index, i1[k]]
 
-    # update command line status
-    print('Revolving 2D matrix to form a 3D matrix...')
 
-    # get size of matrix
-    m, n = mat2D.shape
+@functools.lru_cache(maxsize=1)
+def _revolve_weights(n):
+    """
+    Linear interpolation indices, weights and out-of-range mask mapping a one-sided radial axis of length n onto one
+    n x n quadrant of the (2n - 1) x (2n - 1) cross section used by revolve2d. Only the most recent n is cached, as
+    each entry retains roughly 17 n^2 bytes.
+    """
+    # create the reference axis for one quadrant of the cross section
+    r_axis_one_sided = np.arange(n)
+
+    # compute the distance from every pixel in the quadrant to the rotation
+    # axis, broadcasting the axes so that r is the only array allocated
+    r = np.hypot(r_axis_one_sided[:, np.newaxis], r_axis_one_sided[np.newaxis, :])
 
-    # create the reference axis for the 2D image
-    r_axis_one_sided = np.arange(0, n)
-    r_axis_two_sided = np.arange(-(n - 1), n)
+    r_flat = r.ravel()
+    i0 = np.clip(np.floor(r_flat).astype(np.int32), 0, max(n - 2, 0))
+    i1 = np.minimum(i0 + 1, n - 1)
+    w = r_flat - i0
+    oob = r_flat > n - 1
 
-    # compute the distance from every pixel in the z-y cross-section of the 3D
-    # matrix to the rotation axis
-    z, y = np.meshgrid(r_axis_two_sided, r_axis_two_sided)
-    r = np.sqrt(y ** 2 + z ** 2)
+    for arr in (i0, i1, w, oob):
+        arr.flags.writeable = False
+    return i0, i1, w, oob
 
-    # create empty image matrix
-    mat3D = np.zeros((m, 2 * n - 1, 2 * n - 1))
 
-    # loop through each cross section and create 3D matrix
-    for x_index in range(m):
-        interp = interp1d(x=r_axis_one_sided, y=mat2D[x_index, :], kind='linear', bounds_error=False, fill_value=0)
-        mat3D[x_index, :, :] = interp(r)
+def revolve2d(mat2D):
+    # start timer and update command line status, only if debug logging is enabled
+    verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if verbose:
+        TicToc.tic()
+        logging.debug('Revolving 2D matrix to form a 3D matrix...')
+
+    # get size of matrix
+    m, n = mat2D.shape
+
+    # get the interpolation indices and weights for one quadrant of the radial
+    # grid, which are identical for every cross section
+    i0, i1, w, oob = _revolve_weights(n)
+
+    # interpolate one quadrant of all cross sections, setting values outside
+    # the reference axis to zero
+    if njit is not None:
+        quadrant = np.empty((m, w.size))
+        _revolve_kernel(mat2D, i0, i1, w, oob, quadrant)
+    else:
+        # np.take along axis 1 keeps the gathered slices C-contiguous
+        quadrant = (1 - w) * np.take(mat2D, i0, axis=1) + w * np.take(mat2D, i1, axis=1)
+        quadrant[:, oob] = 0
+    quadrant = quadrant.reshape((m, n, n))
+
+    # the radial grid is symmetric about both axes of the cross section, so
+    # mirror the quadrant to fill the remaining three
+    mat3D = np.empty((m, 2 * n - 1, 2 * n - 1))
+    mat3D[:, n - 1:, n - 1:] = quadrant
+    mat3D[:, n - 1:, :n - 1] = quadrant[:, :, :0:-1]
+    mat3D[:, :n - 1, :] = mat3D[:, :n - 1:-1, :]
 
     # update command line status
-    print(f'  completed in {scale_time(TicToc.toc())}s')
+    if verbose:
+        logging.debug(f'  completed in {scale_time(TicToc.toc())}s')
     return mat3D
@@ -268,9 +268,7 @@ def get_win(N: Union[int, List[int]],
             [x, y] = ndgrid(xx, yy)
             r = np.sqrt(x ** 2 + y ** 2)
             r[r > radius] = radius
-            interp_func = scipy.interpolate.interp1d(ll, win_lin)
-            win = interp_func(r)
-            win[r <= radius] = interp_func(r[r <= radius])
+            win = np.interp(r, ll, win_lin)
 
         else:
             # create the window in each dimension using getWin recursively
@@ -307,9 +305,7 @@ def get_win(N: Union[int, List[int]],
             r[r > radius] = radius
 
             win_lin = np.squeeze(win_lin)
-            interp_func = scipy.interpolate.interp1d(ll, win_lin)
-            win = interp_func(r)
-            win[r <= radius] = interp_func(r[r <= radius])
+            win = np.interp(r, ll, win_lin)
 
         else:
 
@@ -653,7 +649,7 @@ def unmask_sensor_data(kgrid, sensor, sensor_data: np.ndarray) -> np.ndarray:
     flat_sensor_mask = (sensor.mask != 0).flatten('F')
     assignment_mask = unflatten_matlab_mask(unmasked_sensor_data, np.where(flat_sensor_mask)[0])
     # unmasked_sensor_data.flatten('F')[flat_sensor_mask] = sensor_data.flatten()
-    unmasked_sensor_data[assignment_mask] = sensor_data.flatten()
+    unmasked_sensor_data[assignment_mask] = sensor_data.ravel()
     # unmasked_sensor_data[unflatten_matlab_mask(unmasked_sensor_data, sensor.mask != 0)] = sensor_data
     return unmasked_sensor_data
 
@@ -36,28 +36,28 @@ def test_ivp_axisymmetric_simulation():
 
     # define the properties of the propagation medium
     medium = kWaveMedium(
-        sound_speed=1500 * np.ones((Nx, Ny)),   # [m/s]
-        density=1000 * np.ones((Nx, Ny))        # [kg/m^3]
+        sound_speed=np.full((Nx, Ny), 1500, dtype=np.float32),   # [m/s]
+        density=np.full((Nx, Ny), 1000, dtype=np.float32)        # [kg/m^3]
     )
     medium.sound_speed[Nx//2-1:, :] = 1800      # [m/s]
     medium.density[Nx//2-1:, :]     = 1200      # [kg/m^3]
 
     # create initial pressure distribution in the shape of a disc - this is
-    # generated on a 2D grid that is doubled in size in the radial (y)
-    # direction, and then trimmed so that only half the disc is retained
+    # defined on a 2D grid that is doubled in size in the radial (y)
+    # direction, of which only the half containing the retained half of the
+    # disc is generated
     source = kSource()
-    source.p0 = 10 * make_disc(Nx, 2 * Ny, Nx // 4 + 8, Ny + 1, 5)
-    source.p0 = source.p0[:, Ny:]
+    source.p0 = 10 * make_disc(Nx, 2 * Ny, Nx // 4 + 8, Ny + 1, 5, y_slice=slice(Ny, None))
 
     # define a Cartesian sensor mask with points in the shape of a circle
     # REPLACED BY FARID cartesian mask with binary. Otherwise, SaveToDisk doesn't work.
     # sensor.mask = makeCartCircle(40 * dx, 50);
-    sensor_mask = np.zeros((Nx, Ny))
+    sensor_mask = np.zeros((Nx, Ny), dtype=np.uint8)
     sensor_mask[0, :] = 1
     sensor = kSensor(sensor_mask)
 
     # remove points from sensor mask where y < 0
-    sensor.mask[:, sensor.mask[1, :] < 0] = np.nan
+    sensor.mask[:, sensor.mask[1, :] < 0] = 0
 
     # set the input settings
     input_filename  = f'example_input.h5'
@@ -7,7 +7,7 @@
     Simulating Ultrasound Beam Patterns examples.
 """
 import os
-from copy import deepcopy
+from copy import copy
 from tempfile import gettempdir
 
 # noinspection PyUnresolvedReferences
@@ -37,8 +37,8 @@ def test_ivp_heterogeneous_medium():
 
     # define the properties of the propagation medium
     medium = kWaveMedium(
-        sound_speed=1500 * np.ones((Nx, Ny)),
-        density=1000 * np.ones((Nx, Ny))
+        sound_speed=np.full((Nx, Ny), 1500, dtype=np.float32),
+        density=np.full((Nx, Ny), 1000, dtype=np.float32)
     )
     medium.sound_speed[0:Nx//2, :] = 1800         # [m/s]
     medium.density[:, Ny//4-1:Ny] = 1200          # [kg/m^3]
@@ -74,7 +74,7 @@ def test_ivp_heterogeneous_medium():
     kspaceFirstOrder2DC(**{
         'medium': medium,
         'kgrid': kgrid,
-        'source': deepcopy(source),
+        'source': copy(source),
         'sensor': sensor,
         **input_args
     })
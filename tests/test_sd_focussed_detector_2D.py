@@ -7,7 +7,7 @@
     Simulating Ultrasound Beam Patterns examples.
 """
 import os
-from copy import deepcopy
+from copy import copy
 from tempfile import gettempdir
 
 # noinspection PyUnresolvedReferences
@@ -64,7 +64,7 @@ def test_sd_focussed_detector_2d():
     kspaceFirstOrder2DC(**{
         'medium': medium,
         'kgrid': kgrid,
-        'source': deepcopy(source),
+        'source': copy(source),
         'sensor': sensor,
         **input_args
     })
@@ -7,8 +7,9 @@ from kwave.utils.conversion import db2neper, neper2db
 from kwave.utils.filters import extract_amp_phase, spect, apply_filter
 from kwave.utils.interp import get_bli
 from kwave.utils.mapgen import hounsfield2density, fit_power_law_params, power_law_kramers_kronig, make_cart_circle, \
-    make_cart_sphere
-from kwave.utils.matrix import gradient_fd, resize
+    make_cart_sphere, make_disc
+from kwave.utils import matrix
+from kwave.utils.matrix import gradient_fd, get_gradient_fn, resize, revolve2d
 from kwave.utils.signals import tone_burst, add_noise, gradient_spect
 
 input_signal = np.array([0., 0.00099663, 0.00646706, 0.01316044, 0.01851998,
@@ -278,6 +279,28 @@ def test_gradient_FD_2D():
     pass
 
 
+def test_get_gradient_fn():
+    f = np.array([[1, 2, 6], [3, 4, 5]], dtype=float)
+
+    # no spacing or dimension binds np.gradient itself
+    grad_fn = get_gradient_fn()
+    assert grad_fn is np.gradient
+    grad = grad_fn(f)
+    assert np.allclose(grad[0], [[2., 2., -1.], [2., 2., -1.]])
+    assert np.allclose(grad[1], [[1., 2.5, 4.], [1., 1., 1.]])
+
+    # spacing only
+    grad = get_gradient_fn(2)(f)
+    assert np.allclose(grad[0], [[1., 1., -0.5], [1., 1., -0.5]])
+    assert np.allclose(grad[1], [[0.5, 1.25, 2.], [0.5, 0.5, 0.5]])
+
+    # dimension only
+    assert np.allclose(get_gradient_fn(dim=0)(f), [[2., 2., -1.], [2., 2., -1.]])
+
+    # spacing and dimension
+    assert np.allclose(get_gradient_fn(2, dim=1)(f), [[0.5, 1.25, 2.], [0.5, 0.5, 0.5]])
+
+
 # def test_gradient_FD_2D_ndim_spacing():
 #     f = np.array([[1, 2, 6], [3, 4, 5]], dtype=float)
 #     dx = 2
@@ -3155,11 +3178,59 @@ def test_resize_2D_nearest_smaller():
     assert np.all(p1.T == [0., 1.])
 
 
+def test_resize_2D_singleton_dimension():
+    # a trailing singleton dimension is kept when new_size includes it
+    p0 = np.linspace(0, 1, 10).reshape(10, 1)
+    new_size = [19, 1]
+
+    p1 = resize(p0, new_size, interp_mode='linear')
+    assert p1.shape == tuple(new_size)
+    assert np.allclose(p1[:, 0], np.linspace(0, 1, 19))
+
+
+def revolve2d_reference(mat2D):
+    # interpolate each row of mat2D onto the distance from the rotation axis
+    n = mat2D.shape[1]
+    r_axis_two_sided = np.arange(-(n - 1), n)
+    r = np.hypot(r_axis_two_sided[:, np.newaxis], r_axis_two_sided[np.newaxis, :])
+    return np.stack([np.interp(r, np.arange(n), row, right=0) for row in mat2D])
+
+
+@pytest.mark.parametrize('m, n', [(1, 1), (3, 1), (4, 2), (5, 5), (6, 6), (3, 7)])
+def test_revolve2d_numpy(monkeypatch, m, n):
+    # force the NumPy fallback used when numba is not installed
+    monkeypatch.setattr(matrix, 'njit', None)
+    mat2D = np.random.default_rng(0).random((m, n))
+
+    mat3D = revolve2d(mat2D)
+    assert mat3D.shape == (m, 2 * n - 1, 2 * n - 1)
+    assert np.allclose(mat3D, revolve2d_reference(mat2D))
+
+
+@pytest.mark.skipif(matrix.njit is None, reason='numba is not installed')
+@pytest.mark.parametrize('m, n', [(1, 1), (3, 1), (4, 2), (5, 5), (6, 6), (3, 7)])
+def test_revolve2d_numba(m, n):
+    mat2D = np.random.default_rng(0).random((m, n))
+
+    mat3D = revolve2d(mat2D)
+    assert mat3D.shape == (m, 2 * n - 1, 2 * n - 1)
+    assert np.allclose(mat3D, revolve2d_reference(mat2D))
+
+
 def test_make_cart_circle():
     # test it runs
     make_cart_circle(5, 40)
 
 
+def test_make_disc_slice():
+    # only the selected part of the grid is returned, wrapping across the grid edge
+    Nx, Ny = 32, 40
+    disc = make_disc(Nx, Ny, 3, 21, 6)
+    half_disc = make_disc(Nx, Ny, 3, 21, 6, x_slice=slice(Nx // 2), y_slice=slice(Ny // 2, None))
+    assert half_disc.shape == (Nx // 2, Ny // 2)
+    assert np.all(half_disc == disc[:Nx // 2, Ny // 2:])
+
+
 def test_make_cart_sphere():
     # test it runs
     make_cart_sphere(5, 40)